@@ -3,6 +3,7 @@ import random
 from datetime import datetime
 import os
 from faker import Faker
+from partitions_ventes import MAIN_DB_PATH, inserer_ventes, supprimer_partitions
 
 fake = Faker('fr_FR')
 
@@ -10,7 +11,7 @@ def init_db():
     """Initialise la base de données avec des données de démonstration."""
     
     # Configuration des chemins
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'ventes_magasin.db')
+    db_path = MAIN_DB_PATH
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
     try:
@@ -31,20 +32,13 @@ def init_db():
                      email TEXT UNIQUE,
                      ville TEXT)''')
         
-        c.execute('''CREATE TABLE IF NOT EXISTS ventes
-                    (id INTEGER PRIMARY KEY,
-                     produit_id INTEGER NOT NULL,
-                     client_id INTEGER NOT NULL,
-                     date TEXT NOT NULL,
-                     quantite INTEGER NOT NULL CHECK(quantite > 0),
-                     montant REAL NOT NULL,
-                     FOREIGN KEY(produit_id) REFERENCES produits(id),
-                     FOREIGN KEY(client_id) REFERENCES clients(id))''')
+        # Les ventes sont stockées dans une base par mois (voir partitions_ventes.py)
+        c.execute("DROP TABLE IF EXISTS ventes")
         
         # Nettoyage des anciennes données
         c.execute("DELETE FROM produits")
         c.execute("DELETE FROM clients")
-        c.execute("DELETE FROM ventes")
+        supprimer_partitions()
         
         # Insertion de produits
         produits = [
@@ -66,6 +60,7 @@ def init_db():
         c.executemany("INSERT INTO clients VALUES (?,?,?,?)", clients)
         
         # Génération de ventes
+        ventes = []
         for i in range(1, 201):
             date = fake.date_between(start_date='-2y', end_date='today').strftime("%Y-%m-%d")
             produit_id = random.randint(1, 10)
@@ -79,10 +74,10 @@ def init_db():
             remise = random.choice([0, 0, 0, 0.1, 0.15])
             montant = round(prix * quantite * (1 - remise), 2)
             
-            c.execute("INSERT INTO ventes VALUES (?,?,?,?,?,?)",
-                     (i, produit_id, client_id, date, quantite, montant))
+            ventes.append((i, produit_id, client_id, date, quantite, montant))
         
         conn.commit()
+        inserer_ventes(ventes)
         print("Base initialisée avec succès : 10 produits, 20 clients, 200 ventes")
         
     except Exception as e:
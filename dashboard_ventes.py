@@ -1,12 +1,15 @@
 import dash
 from dash import Dash, dcc, html, Input, Output, dash_table, callback, State
-import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
 import sqlite3
 import os
 import dash_bootstrap_components as dbc
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import threading
+from graphiques_ventes import calculer_graphiques
+from partitions_ventes import (MAIN_DB_PATH, bornes_ventes, chemin_partition, lire_ventes,
+                               lister_partitions, migrer_table_ventes)
 
 # 1. Initialisation de l'application avec thème professionnel et mode sombre
 app = Dash(__name__, 
@@ -18,32 +21,84 @@ app.title = "Analytics Dashboard - Business Intelligence"
 # Variable pour le mode sombre
 dark_mode = False
 
+# Calcul parallèle des graphiques (activable avec DASHBOARD_PARALLEL_CHARTS=1).
+# Les six agrégations pandas (groupby / pivot) tournent dans un pool de threads
+# sur le même DataFrame filtré, sans copie ; les figures plotly sont ensuite
+# construites en séquence à partir des petits résultats agrégés. Seules les
+# agrégations profitent des threads : sur quelques centaines de ventes elles
+# pèsent ~8 ms sur ~200 ms, la construction des figures dominant ; le gain ne
+# concerne que les gros volumes sur une machine multi-cœurs, d'où le mode
+# séquentiel par défaut. Le pool est partagé par toutes les requêtes : avec
+# plusieurs utilisateurs simultanés, les agrégations d'une requête attendent
+# celles des autres. Dimensionner DASHBOARD_CHART_WORKERS selon la concurrence
+# du serveur (6 par requête simultanée), ou rester en séquentiel derrière un
+# serveur multi-processus (gunicorn...).
+PARALLEL_CHARTS = os.environ.get('DASHBOARD_PARALLEL_CHARTS', '0') == '1'
+CHART_WORKERS = int(os.environ.get('DASHBOARD_CHART_WORKERS', 6))
+chart_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS,
+                                    thread_name_prefix='graphiques') if PARALLEL_CHARTS else None
+
 # 2. Connexion à la base de données et fonctions CRUD
 def get_db_connection():
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'ventes_magasin.db')
-    return sqlite3.connect(db_path)
+    return sqlite3.connect(MAIN_DB_PATH)
 
-def get_data():
-    conn = get_db_connection()
-    
+def get_data(start_date=None, end_date=None):
+    # Les ventes sont partitionnées par mois : seules les partitions
+    # couvrant [start_date, end_date] sont lues (voir partitions_ventes.py)
     query = """
     SELECT v.id, v.date, v.montant, v.quantite,
            p.nom as produit, p.categorie, p.prix_unitaire,
            c.nom as client, c.ville, c.email
     FROM ventes v
-    JOIN produits p ON v.produit_id = p.id
-    JOIN clients c ON v.client_id = c.id
+    JOIN main_db.produits p ON v.produit_id = p.id
+    JOIN main_db.clients c ON v.client_id = c.id
+    WHERE v.date >= :debut AND v.date < :fin
     """
     
-    df = pd.read_sql(query, conn)
+    df = lire_ventes(query, start_date, end_date)
     df['date'] = pd.to_datetime(df['date'])
     df['mois'] = df['date'].dt.to_period('M').astype(str)
     df['trimestre'] = df['date'].dt.to_period('Q').astype(str)
     df['jour_semaine'] = df['date'].dt.day_name()
     
-    conn.close()
     return df
 
+# Cache des ventes en mémoire : `df` couvre la période [debut, fin] et n'est
+# étendu que pour les mois manquants. Il est invalidé par les modifications
+# de clients/produits et dès qu'une partition change sur disque
+# (migration, archivage, restauration, nouvelles ventes).
+FENETRE_INITIALE_MOIS = 12
+cache_ventes = {'df': None, 'debut': None, 'fin': None, 'signature': None}
+verrou_ventes = threading.Lock()
+
+def signature_partitions():
+    return tuple((p, os.path.getmtime(chemin_partition(p))) for p in lister_partitions())
+
+def invalider_cache_ventes():
+    with verrou_ventes:
+        cache_ventes.update(df=None, debut=None, fin=None, signature=None)
+
+def get_data_periode(start_date, end_date):
+    debut = pd.Timestamp(start_date).normalize()
+    fin = pd.Timestamp(end_date).normalize()
+    with verrou_ventes:
+        signature = signature_partitions()
+        if cache_ventes['df'] is None or cache_ventes['signature'] != signature:
+            cache_ventes.update(df=get_data(debut, fin), debut=debut, fin=fin, signature=signature)
+        else:
+            # Seuls les mois hors de la période déjà chargée sont lus sur disque
+            morceaux = [cache_ventes['df']]
+            if debut < cache_ventes['debut']:
+                morceaux.append(get_data(debut, cache_ventes['debut'] - timedelta(days=1)))
+            if fin > cache_ventes['fin']:
+                morceaux.append(get_data(cache_ventes['fin'] + timedelta(days=1), fin))
+            if len(morceaux) > 1:
+                cache_ventes.update(df=pd.concat(morceaux, ignore_index=True),
+                                    debut=min(debut, cache_ventes['debut']),
+                                    fin=max(fin, cache_ventes['fin']))
+        ventes_df = cache_ventes['df']
+    return ventes_df[(ventes_df['date'] >= debut) & (ventes_df['date'] < fin + timedelta(days=1))]
+
 def get_clients():
     conn = get_db_connection()
     df = pd.read_sql("SELECT * FROM clients", conn)
@@ -63,6 +118,7 @@ def add_client(nom, ville, email):
                    (nom, ville, email))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
 def update_client(client_id, nom, ville, email):
     conn = get_db_connection()
@@ -71,6 +127,7 @@ def update_client(client_id, nom, ville, email):
                    (nom, ville, email, client_id))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
 def delete_client(client_id):
     conn = get_db_connection()
@@ -78,6 +135,7 @@ def delete_client(client_id):
     cursor.execute("DELETE FROM clients WHERE id=?", (client_id,))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
 def add_produit(nom, categorie, prix_unitaire):
     conn = get_db_connection()
@@ -86,6 +144,7 @@ def add_produit(nom, categorie, prix_unitaire):
                    (nom, categorie, prix_unitaire))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
 def update_produit(produit_id, nom, categorie, prix_unitaire):
     conn = get_db_connection()
@@ -94,6 +153,7 @@ def update_produit(produit_id, nom, categorie, prix_unitaire):
                    (nom, categorie, prix_unitaire, produit_id))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
 def delete_produit(produit_id):
     conn = get_db_connection()
@@ -101,9 +161,16 @@ def delete_produit(produit_id):
     cursor.execute("DELETE FROM produits WHERE id=?", (produit_id,))
     conn.commit()
     conn.close()
+    invalider_cache_ventes()
 
-# Chargement initial des données
-df = get_data()
+# Chargement initial des données (migration de l'ancienne table ventes si besoin) :
+# seuls les FENETRE_INITIALE_MOIS derniers mois sont lus au démarrage
+migrer_table_ventes()
+date_min, date_max = bornes_ventes()
+date_max = date_max or pd.Timestamp(datetime.now().date())
+date_min = date_min or date_max
+date_debut = max(date_min, date_max - pd.DateOffset(months=FENETRE_INITIALE_MOIS))
+df = get_data_periode(date_debut, date_max)
 clients_df = get_clients()
 produits_df = get_produits()
 
@@ -111,7 +178,7 @@ produits_df = get_produits()
 ca_total = df['montant'].sum()
 ventes_total = df['quantite'].sum()
 clients_uniques = df['client'].nunique()
-panier_moyen = ca_total / len(df)
+panier_moyen = ca_total / len(df) if len(df) else 0
 
 # 4. Layout professionnel avec mode sombre et gestion CRUD
 app.layout = dbc.Container(fluid=True, id='main-container', children=[
@@ -192,17 +259,17 @@ app.layout = dbc.Container(fluid=True, id='main-container', children=[
                             html.Label("Période:"),
                             dcc.DatePickerRange(
                                 id='date-range',
-                                min_date_allowed=df['date'].min(),
-                                max_date_allowed=df['date'].max(),
-                                start_date=df['date'].min(),
-                                end_date=df['date'].max(),
+                                min_date_allowed=date_min,
+                                max_date_allowed=date_max,
+                                start_date=date_debut,
+                                end_date=date_max,
                                 className="mb-3"
                             ),
                             
                             html.Label("Catégories:"),
                             dcc.Dropdown(
                                 id='categorie-filter',
-                                options=[{'label': cat, 'value': cat} for cat in df['categorie'].unique()],
+                                options=[{'label': cat, 'value': cat} for cat in produits_df['categorie'].dropna().unique()],
                                 multi=True,
                                 placeholder="Toutes catégories"
                             ),
@@ -210,7 +277,7 @@ app.layout = dbc.Container(fluid=True, id='main-container', children=[
                             html.Label("Villes:", className="mt-3"),
                             dcc.Dropdown(
                                 id='ville-filter',
-                                options=[{'label': ville, 'value': ville} for ville in df['ville'].unique()],
+                                options=[{'label': ville, 'value': ville} for ville in clients_df['ville'].dropna().unique()],
                                 multi=True,
                                 placeholder="Toutes villes"
                             )
@@ -361,7 +428,29 @@ app.layout = dbc.Container(fluid=True, id='main-container', children=[
 ])
 
 # 5. Callbacks pour l'interactivité
-# Callback pour les graphiques principaux (inchangé)
+# Filtrage partagé et construction des graphiques
+def filtrer_ventes(start_date, end_date, categories, villes):
+    # Filtrage par date : masque sur les ventes en cache, seuls les mois
+    # non encore chargés sont lus dans les partitions
+    if start_date and end_date:
+        ventes_df = get_data_periode(start_date, end_date)
+    else:
+        ventes_df = get_data_periode(date_min, bornes_ventes()[1] or date_max)
+    
+    # Masque booléen unique calculé une seule fois puis partagé par tous les graphiques
+    mask = pd.Series(True, index=ventes_df.index)
+    
+    # Filtrage par catégorie
+    if categories:
+        mask &= ventes_df['categorie'].isin(categories)
+    
+    # Filtrage par ville
+    if villes:
+        mask &= ventes_df['ville'].isin(villes)
+    
+    return ventes_df[mask]
+
+# Callback pour les graphiques principaux
 @callback(
     [Output('evolution-ca', 'figure'),
      Output('repartition-ca', 'figure'),
@@ -376,84 +465,9 @@ app.layout = dbc.Container(fluid=True, id='main-container', children=[
      Input('ville-filter', 'value')]
 )
 def update_all(start_date, end_date, categories, villes):
-    filtered_df = df.copy()
-    
-    # Filtrage par date
-    if start_date and end_date:
-        filtered_df = filtered_df[
-            (filtered_df['date'] >= start_date) & 
-            (filtered_df['date'] <= end_date)
-        ]
-    
-    # Filtrage par catégorie
-    if categories:
-        filtered_df = filtered_df[filtered_df['categorie'].isin(categories)]
-    
-    # Filtrage par ville
-    if villes:
-        filtered_df = filtered_df[filtered_df['ville'].isin(villes)]
-    
-    # Graphique 1: Évolution du CA
-    fig1 = px.line(
-        filtered_df.groupby('mois')['montant'].sum().reset_index(),
-        x='mois',
-        y='montant',
-        title="Évolution du Chiffre d'Affaires",
-        labels={'mois': 'Mois', 'montant': 'CA (€)'}
-    )
-    fig1.update_layout(hovermode="x unified")
-    
-    # Graphique 2: Répartition du CA
-    fig2 = px.pie(
-        filtered_df.groupby('categorie')['montant'].sum().reset_index(),
-        names='categorie',
-        values='montant',
-        title="Répartition par Catégorie",
-        hole=0.4
-    )
-    
-    # Graphique 3: Top produits
-    fig3 = px.bar(
-        filtered_df.groupby('produit')['montant'].sum().nlargest(10).reset_index(),
-        x='produit',
-        y='montant',
-        title="Top 10 Produits",
-        color='produit'
-    )
-    
-    # Graphique 4: Top clients
-    fig4 = px.bar(
-        filtered_df.groupby('client')['montant'].sum().nlargest(10).reset_index(),
-        x='client',
-        y='montant',
-        title="Top 10 Clients",
-        color='client'
-    )
-    
-    # Graphique 5: Sunburst
-    fig5 = px.sunburst(
-        filtered_df,
-        path=['categorie', 'produit'],
-        values='montant',
-        title="Analyse Hiérarchique"
-    )
-    
-    # Graphique 6: Heatmap
-    heatmap_data = filtered_df.pivot_table(
-        index='jour_semaine',
-        columns=filtered_df['date'].dt.hour,
-        values='montant',
-        aggfunc='sum'
-    )
-    fig6 = go.Figure(go.Heatmap(
-        x=heatmap_data.columns,
-        y=heatmap_data.index,
-        z=heatmap_data.values,
-        colorscale='Viridis'
-    ))
-    fig6.update_layout(title="Heatmap des Ventes par Jour/Heure")
-    
-    return fig1, fig2, fig3, fig4, fig5, fig6, filtered_df.to_dict('records')
+    filtered_df = filtrer_ventes(start_date, end_date, categories, villes)
+    figures = calculer_graphiques(filtered_df, chart_executor)
+    return (*figures, filtered_df.to_dict('records'))
 
 # Callback pour l'export CSV
 @callback(
@@ -462,7 +476,7 @@ def update_all(start_date, end_date, categories, villes):
     prevent_initial_call=True
 )
 def export_data(n_clicks):
-    return dcc.send_data_frame(df.to_csv, "export_ventes.csv")
+    return dcc.send_data_frame(get_data_periode(date_min, bornes_ventes()[1] or date_max).to_csv, "export_ventes.csv")
 
 # Callbacks pour la gestion des clients
 @callback(
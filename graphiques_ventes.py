@@ -0,0 +1,111 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Chaque graphique du tableau de bord est découpé en deux étapes :
+# - une agrégation pandas (groupby / pivot) sur les ventes filtrées,
+# - la construction de la figure plotly à partir du petit résultat agrégé.
+# Les agrégations sont indépendantes et peuvent tourner dans un pool de threads ;
+# la construction des figures (Python pur, garde le GIL) reste séquentielle.
+
+# Graphique 1: Évolution du CA
+def agreger_evolution_ca(filtered_df):
+    return filtered_df.groupby('mois')['montant'].sum().reset_index()
+
+def figure_evolution_ca(data):
+    fig = px.line(
+        data,
+        x='mois',
+        y='montant',
+        title="Évolution du Chiffre d'Affaires",
+        labels={'mois': 'Mois', 'montant': 'CA (€)'}
+    )
+    fig.update_layout(hovermode="x unified")
+    return fig
+
+# Graphique 2: Répartition du CA
+def agreger_repartition_ca(filtered_df):
+    return filtered_df.groupby('categorie')['montant'].sum().reset_index()
+
+def figure_repartition_ca(data):
+    return px.pie(
+        data,
+        names='categorie',
+        values='montant',
+        title="Répartition par Catégorie",
+        hole=0.4
+    )
+
+# Graphique 3: Top produits
+def agreger_top_produits(filtered_df):
+    return filtered_df.groupby('produit')['montant'].sum().nlargest(10).reset_index()
+
+def figure_top_produits(data):
+    return px.bar(
+        data,
+        x='produit',
+        y='montant',
+        title="Top 10 Produits",
+        color='produit'
+    )
+
+# Graphique 4: Top clients
+def agreger_top_clients(filtered_df):
+    return filtered_df.groupby('client')['montant'].sum().nlargest(10).reset_index()
+
+def figure_top_clients(data):
+    return px.bar(
+        data,
+        x='client',
+        y='montant',
+        title="Top 10 Clients",
+        color='client'
+    )
+
+# Graphique 5: Sunburst
+def agreger_sunburst(filtered_df):
+    return filtered_df.groupby(['categorie', 'produit'])['montant'].sum().reset_index()
+
+def figure_sunburst(data):
+    return px.sunburst(
+        data,
+        path=['categorie', 'produit'],
+        values='montant',
+        title="Analyse Hiérarchique"
+    )
+
+# Graphique 6: Heatmap
+def agreger_heatmap(filtered_df):
+    return filtered_df.pivot_table(
+        index='jour_semaine',
+        columns=filtered_df['date'].dt.hour,
+        values='montant',
+        aggfunc='sum'
+    )
+
+def figure_heatmap(heatmap_data):
+    fig = go.Figure(go.Heatmap(
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        z=heatmap_data.values,
+        colorscale='Viridis'
+    ))
+    fig.update_layout(title="Heatmap des Ventes par Jour/Heure")
+    return fig
+
+GRAPHIQUES = [
+    (agreger_evolution_ca, figure_evolution_ca),
+    (agreger_repartition_ca, figure_repartition_ca),
+    (agreger_top_produits, figure_top_produits),
+    (agreger_top_clients, figure_top_clients),
+    (agreger_sunburst, figure_sunburst),
+    (agreger_heatmap, figure_heatmap),
+]
+
+def calculer_graphiques(filtered_df, executor=None):
+    """Renvoie les six figures ; les agrégations passent par `executor` s'il est fourni."""
+    if executor is not None:
+        futures = [executor.submit(agreger, filtered_df) for agreger, _ in GRAPHIQUES]
+        agregats = [future.result() for future in futures]
+    else:
+        agregats = [agreger(filtered_df) for agreger, _ in GRAPHIQUES]
+    return [figure(data) for (_, figure), data in zip(GRAPHIQUES, agregats)]
@@ -0,0 +1,216 @@
+import sqlite3
+import os
+import gzip
+import shutil
+import pandas as pd
+
+# Stockage des ventes partitionné par mois : une base SQLite par mois
+# (data/ventes/ventes_AAAA_MM.db), les produits et clients restent dans
+# ventes_magasin.db. Les archives compressées vont dans data/archives.
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+MAIN_DB_PATH = os.path.join(DATA_DIR, 'ventes_magasin.db')
+PARTITIONS_DIR = os.path.join(DATA_DIR, 'ventes')
+ARCHIVES_DIR = os.path.join(DATA_DIR, 'archives')
+
+SCHEMA_VENTES = '''CREATE TABLE IF NOT EXISTS ventes
+                    (id INTEGER PRIMARY KEY,
+                     produit_id INTEGER NOT NULL,
+                     client_id INTEGER NOT NULL,
+                     date TEXT NOT NULL,
+                     quantite INTEGER NOT NULL CHECK(quantite > 0),
+                     montant REAL NOT NULL)'''
+
+def nom_partition(date):
+    """Renvoie la clé de partition 'AAAA_MM' d'une date."""
+    return pd.Timestamp(date).strftime("%Y_%m")
+
+def chemin_partition(partition):
+    return os.path.join(PARTITIONS_DIR, f"ventes_{partition}.db")
+
+def chemin_archive(partition):
+    return os.path.join(ARCHIVES_DIR, f"ventes_{partition}.db.gz")
+
+def lister_partitions():
+    """Liste triée des partitions mensuelles actives."""
+    if not os.path.isdir(PARTITIONS_DIR):
+        return []
+    return sorted(
+        f[len("ventes_"):-len(".db")]
+        for f in os.listdir(PARTITIONS_DIR)
+        if f.startswith("ventes_") and f.endswith(".db")
+    )
+
+def partitions_pour_periode(start_date=None, end_date=None):
+    """Élagage : ne garde que les partitions qui recouvrent la période demandée."""
+    partitions = lister_partitions()
+    if start_date:
+        debut = nom_partition(start_date)
+        partitions = [p for p in partitions if p >= debut]
+    if end_date:
+        fin = nom_partition(end_date)
+        partitions = [p for p in partitions if p <= fin]
+    return partitions
+
+def bornes_ventes():
+    """(date min, date max) des ventes actives, lues sur les partitions extrêmes non vides."""
+    partitions = lister_partitions()
+    bornes = []
+    for fonction, ordre in (("MIN", partitions), ("MAX", partitions[::-1])):
+        borne = None
+        for partition in ordre:
+            conn = sqlite3.connect(chemin_partition(partition))
+            try:
+                borne = conn.execute(f"SELECT {fonction}(date) FROM ventes").fetchone()[0]
+            finally:
+                conn.close()
+            if borne is not None:
+                break
+        bornes.append(pd.Timestamp(borne) if borne is not None else None)
+    return tuple(bornes)
+
+def connexion_partition(partition):
+    os.makedirs(PARTITIONS_DIR, exist_ok=True)
+    conn = sqlite3.connect(chemin_partition(partition))
+    conn.execute(SCHEMA_VENTES)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_ventes_date ON ventes(date)")
+    return conn
+
+def connexion_partition_vide():
+    # Partition en mémoire utilisée quand aucune partition ne couvre la période
+    conn = sqlite3.connect(':memory:')
+    conn.execute(SCHEMA_VENTES)
+    return conn
+
+def fusionner_dans_partition(source, partition):
+    """Copie les ventes de la base SQLite `source` dans la partition active (ids existants conservés)."""
+    conn = connexion_partition(partition)
+    try:
+        conn.execute("ATTACH DATABASE ? AS source", (source,))
+        conn.execute("INSERT OR IGNORE INTO ventes SELECT * FROM source.ventes")
+        conn.commit()
+    finally:
+        conn.close()
+
+def inserer_ventes(ventes, remplacer=False):
+    """Route chaque vente (id, produit_id, client_id, date, quantite, montant) vers sa partition.
+
+    Avec `remplacer=True`, une vente dont l'id existe déjà est écrasée (reprise de migration).
+    Un mois archivé est d'abord restauré pour ne pas créer une partition concurrente.
+    """
+    instruction = "INSERT OR REPLACE" if remplacer else "INSERT"
+    par_partition = {}
+    for vente in ventes:
+        par_partition.setdefault(nom_partition(vente[3]), []).append(vente)
+    for partition, lignes in par_partition.items():
+        if os.path.exists(chemin_archive(partition)):
+            restaurer_partition(partition)
+        conn = connexion_partition(partition)
+        try:
+            conn.executemany(f"{instruction} INTO ventes VALUES (?,?,?,?,?,?)", lignes)
+            conn.commit()
+        finally:
+            conn.close()
+
+def lire_ventes(query, start_date=None, end_date=None):
+    """Exécute `query` sur chaque partition de la période et concatène les résultats.
+
+    La base principale est attachée sous le nom `main_db` pour les jointures ;
+    les bornes de date sont passées en paramètres :debut (inclus) et :fin (exclu).
+    """
+    frames = []
+    params = {
+        'debut': str(pd.Timestamp(start_date).date()) if start_date else '0000-01-01',
+        'fin': str((pd.Timestamp(end_date) + pd.Timedelta(days=1)).date()) if end_date else '9999-12-31',
+    }
+    for partition in partitions_pour_periode(start_date, end_date):
+        conn = sqlite3.connect(chemin_partition(partition))
+        try:
+            conn.execute("ATTACH DATABASE ? AS main_db", (MAIN_DB_PATH,))
+            frames.append(pd.read_sql(query, conn, params=params))
+        finally:
+            conn.close()
+    if not frames:
+        conn = connexion_partition_vide()
+        try:
+            conn.execute("ATTACH DATABASE ? AS main_db", (MAIN_DB_PATH,))
+            return pd.read_sql(query, conn, params=params)
+        finally:
+            conn.close()
+    return pd.concat(frames, ignore_index=True)
+
+def supprimer_partitions():
+    """Supprime toutes les partitions actives (réinitialisation des données)."""
+    for partition in lister_partitions():
+        os.remove(chemin_partition(partition))
+
+def migrer_table_ventes():
+    """Répartit l'ancienne table `ventes` de ventes_magasin.db dans les partitions mensuelles.
+
+    Relançable sans risque : les ventes déjà copiées sont remplacées, et la table
+    d'origine n'est supprimée qu'une fois toutes les partitions validées.
+    """
+    conn = sqlite3.connect(MAIN_DB_PATH)
+    try:
+        existe = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='ventes'"
+        ).fetchone()
+        if not existe:
+            return 0
+        ventes = conn.execute(
+            "SELECT id, produit_id, client_id, date, quantite, montant FROM ventes"
+        ).fetchall()
+        inserer_ventes(ventes, remplacer=True)
+        conn.execute("DROP TABLE ventes")
+        conn.commit()
+        conn.execute("VACUUM")
+        return len(ventes)
+    finally:
+        conn.close()
+
+def archiver_partitions(avant_date):
+    """Compresse (gzip) dans data/archives les partitions antérieures au mois de `avant_date`.
+
+    Si le mois a déjà une archive, elle est d'abord fusionnée avec la partition active.
+    """
+    limite = nom_partition(avant_date)
+    os.makedirs(ARCHIVES_DIR, exist_ok=True)
+    archivees = []
+    for partition in lister_partitions():
+        if partition >= limite:
+            continue
+        if os.path.exists(chemin_archive(partition)):
+            restaurer_partition(partition)
+        source = chemin_partition(partition)
+        conn = sqlite3.connect(source)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        temporaire = chemin_archive(partition) + ".tmp"
+        with open(source, 'rb') as f_in, gzip.open(temporaire, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(temporaire, chemin_archive(partition))
+        os.remove(source)
+        archivees.append(partition)
+    return archivees
+
+def restaurer_partition(partition):
+    """Décompresse une partition archivée pour la remettre en ligne.
+
+    Si une partition active existe déjà pour ce mois, l'archive y est fusionnée.
+    """
+    archive = chemin_archive(partition)
+    os.makedirs(PARTITIONS_DIR, exist_ok=True)
+    cible = chemin_partition(partition)
+    active = os.path.exists(cible)
+    temporaire = cible + ".tmp"
+    with gzip.open(archive, 'rb') as f_in, open(temporaire, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    if active:
+        try:
+            fusionner_dans_partition(temporaire, partition)
+        finally:
+            os.remove(temporaire)
+    else:
+        os.replace(temporaire, cible)
+    os.remove(archive)
@@ -0,0 +1,43 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import graphiques_ventes
+
+
+def ventes_exemple():
+    dates = pd.date_range("2024-01-01", periods=200, freq="37h")
+    df = pd.DataFrame({
+        'date': dates,
+        'montant': [float(10 + i % 17) for i in range(200)],
+        'categorie': [['Audio', 'Mobile', 'Maison', 'Bureau', 'Informatique'][i % 5] for i in range(200)],
+        'produit': [f"Produit {i % 12}" for i in range(200)],
+        'client': [f"Client {i % 23}" for i in range(200)],
+    })
+    df['mois'] = df['date'].dt.to_period('M').astype(str)
+    df['jour_semaine'] = df['date'].dt.day_name()
+    return df
+
+
+class GraphiquesVentesTest(unittest.TestCase):
+    def test_parallele_identique_au_sequentiel(self):
+        df = ventes_exemple()
+        sequentiel = graphiques_ventes.calculer_graphiques(df)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            parallele = graphiques_ventes.calculer_graphiques(df, executor)
+
+        self.assertEqual(len(sequentiel), len(graphiques_ventes.GRAPHIQUES))
+        for fig_seq, fig_par in zip(sequentiel, parallele):
+            # to_dict() contient des tableaux numpy : on compare sa sérialisation JSON
+            self.assertEqual(fig_seq.to_json(), fig_par.to_json())
+
+    def test_ventes_vides(self):
+        df = ventes_exemple().iloc[:0]
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            figures = graphiques_ventes.calculer_graphiques(df, executor)
+        self.assertEqual(len(figures), len(graphiques_ventes.GRAPHIQUES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import partitions_ventes
+
+QUERY = """
+SELECT v.id, v.date, p.nom as produit
+FROM ventes v
+JOIN main_db.produits p ON v.produit_id = p.id
+WHERE v.date >= :debut AND v.date < :fin
+"""
+
+VENTES = [
+    (1, 1, 1, "2024-01-31", 1, 10.0),
+    (2, 1, 1, "2024-02-01", 1, 10.0),
+    (3, 1, 1, "2024-02-29", 1, 10.0),
+    (4, 1, 1, "2024-03-01", 1, 10.0),
+    (5, 1, 1, "2024-04-15", 1, 10.0),
+]
+
+
+class PartitionsVentesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        data_dir = self.tmp.name
+        chemins = {
+            'MAIN_DB_PATH': os.path.join(data_dir, 'ventes_magasin.db'),
+            'PARTITIONS_DIR': os.path.join(data_dir, 'ventes'),
+            'ARCHIVES_DIR': os.path.join(data_dir, 'archives'),
+        }
+        for nom, chemin in chemins.items():
+            patcher = mock.patch.object(partitions_ventes, nom, chemin)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+        conn = sqlite3.connect(partitions_ventes.MAIN_DB_PATH)
+        conn.execute("CREATE TABLE produits (id INTEGER PRIMARY KEY, nom TEXT)")
+        conn.execute("INSERT INTO produits VALUES (1, 'Laptop Elite')")
+        conn.commit()
+        conn.close()
+
+    def lire(self, start_date, end_date):
+        # Renvoie les ids lus et les fichiers SQLite ouverts par lire_ventes
+        connect = sqlite3.connect
+        with mock.patch.object(partitions_ventes.sqlite3, 'connect', side_effect=connect) as espion:
+            df = partitions_ventes.lire_ventes(QUERY, start_date, end_date)
+        ouverts = [os.path.basename(appel.args[0]) for appel in espion.call_args_list]
+        return sorted(df['id'].tolist()), ouverts
+
+    def test_routage_par_mois(self):
+        partitions_ventes.inserer_ventes(VENTES)
+        self.assertEqual(partitions_ventes.lister_partitions(),
+                         ['2024_01', '2024_02', '2024_03', '2024_04'])
+
+    def test_bornes_ventes(self):
+        self.assertEqual(partitions_ventes.bornes_ventes(), (None, None))
+        partitions_ventes.inserer_ventes(VENTES)
+        self.assertEqual(partitions_ventes.bornes_ventes(),
+                         (pd.Timestamp("2024-01-31"), pd.Timestamp("2024-04-15")))
+
+    def test_elagage_et_bornes_inclusives(self):
+        partitions_ventes.inserer_ventes(VENTES)
+        ids, ouverts = self.lire("2024-02-01", "2024-02-29")
+        self.assertEqual(ids, [2, 3])
+        self.assertEqual(ouverts, ['ventes_2024_02.db'])
+
+        ids, ouverts = self.lire("2024-01-31", "2024-03-01")
+        self.assertEqual(ids, [1, 2, 3, 4])
+        self.assertEqual(ouverts, ['ventes_2024_01.db', 'ventes_2024_02.db', 'ventes_2024_03.db'])
+
+    def test_periode_sans_partition(self):
+        partitions_ventes.inserer_ventes(VENTES)
+        ids, ouverts = self.lire("2023-06-01", "2023-06-30")
+        self.assertEqual(ids, [])
+        self.assertEqual(ouverts, [':memory:'])
+
+    def test_archivage_et_restauration(self):
+        partitions_ventes.inserer_ventes(VENTES)
+        self.assertEqual(partitions_ventes.archiver_partitions("2024-03-01"), ['2024_01', '2024_02'])
+        self.assertEqual(partitions_ventes.lister_partitions(), ['2024_03', '2024_04'])
+        self.assertEqual(self.lire(None, None)[0], [4, 5])
+
+        partitions_ventes.restaurer_partition('2024_02')
+        self.assertEqual(self.lire("2024-02-01", "2024-02-29")[0], [2, 3])
+
+    def test_vente_tardive_sur_mois_archive(self):
+        partitions_ventes.inserer_ventes(VENTES[:2])
+        partitions_ventes.archiver_partitions("2024-02-01")
+        # Vente tardive : le mois archivé est restauré avant l'insertion
+        partitions_ventes.inserer_ventes([(6, 1, 1, "2024-01-20", 1, 10.0)])
+        self.assertFalse(os.path.exists(partitions_ventes.chemin_archive('2024_01')))
+
+        partitions_ventes.archiver_partitions("2024-03-01")
+        partitions_ventes.restaurer_partition('2024_01')
+        self.assertEqual(self.lire("2024-01-01", "2024-01-31")[0], [1, 6])
+
+    def test_archivage_fusionne_archive_existante(self):
+        partitions_ventes.inserer_ventes(VENTES[:1])
+        partitions_ventes.archiver_partitions("2024-02-01")
+        # Partition créée en contournant le routage : archive et partition coexistent
+        conn = partitions_ventes.connexion_partition('2024_01')
+        conn.execute("INSERT INTO ventes VALUES (7, 1, 1, '2024-01-05', 1, 10.0)")
+        conn.commit()
+        conn.close()
+
+        partitions_ventes.archiver_partitions("2024-02-01")
+        partitions_ventes.restaurer_partition('2024_01')
+        self.assertEqual(self.lire(None, None)[0], [1, 7])
+
+    def test_restauration_fusionne_partition_active(self):
+        partitions_ventes.inserer_ventes(VENTES[:1])
+        partitions_ventes.archiver_partitions("2024-02-01")
+        conn = partitions_ventes.connexion_partition('2024_01')
+        conn.execute("INSERT INTO ventes VALUES (7, 1, 1, '2024-01-05', 1, 10.0)")
+        conn.commit()
+        conn.close()
+
+        partitions_ventes.restaurer_partition('2024_01')
+        self.assertEqual(self.lire(None, None)[0], [1, 7])
+
+    def test_migration_relancable(self):
+        conn = sqlite3.connect(partitions_ventes.MAIN_DB_PATH)
+        conn.execute(partitions_ventes.SCHEMA_VENTES)
+        conn.executemany("INSERT INTO ventes VALUES (?,?,?,?,?,?)", VENTES)
+        conn.commit()
+        conn.close()
+        # Migration interrompue : une partie des ventes est déjà copiée
+        partitions_ventes.inserer_ventes(VENTES[:2])
+
+        self.assertEqual(partitions_ventes.migrer_table_ventes(), len(VENTES))
+        self.assertEqual(partitions_ventes.migrer_table_ventes(), 0)
+        self.assertEqual(self.lire(None, None)[0], [1, 2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()